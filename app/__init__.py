@@ -1,11 +1,41 @@
-from flask import Flask, jsonify
+import os
+import click
+from flask import Flask, jsonify, g, request, has_request_context
 from flask_migrate import Migrate
+from sqlalchemy import event
+from sqlalchemy.orm import configure_mappers
 from config import config
-from app.extensions import db, cors
+from app.extensions import db, cors, cache
+from app.json_provider import OrjsonProvider
+
+# Per-connection SQLite tuning: WAL lets readers run alongside a writer,
+# synchronous=NORMAL is safe with WAL, and larger cache/mmap keep hot pages in memory.
+# foreign_keys=ON makes SQLite enforce the FK constraints like other backends do
+SQLITE_PRAGMAS = (
+    'PRAGMA foreign_keys=ON',
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY',
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    # Per-request SQL statement counter used by the SQL_QUERY_WARN_THRESHOLD check
+    if has_request_context():
+        g.sql_query_count = g.get('sql_query_count', 0) + 1
 
 def create_app(config_name='default'):
     """Application factory pattern"""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Load configuration
     app.config.from_object(config[config_name])
@@ -14,7 +44,23 @@ def create_app(config_name='default'):
     # Initialize extensions
     db.init_app(app)
     cors.init_app(app)  # Allow all domains for all routes
+    cache.init_app(app)
     migrate = Migrate(app, db)
+
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', _set_sqlite_pragmas)
+        if app.config.get('SQL_QUERY_WARN_THRESHOLD'):
+            event.listen(db.engine, 'before_cursor_execute', _count_query)
+
+    # Development guard against N+1 regressions: flag requests issuing too many statements
+    if app.config.get('SQL_QUERY_WARN_THRESHOLD'):
+        @app.after_request
+        def warn_on_query_count(response):
+            query_count = g.get('sql_query_count', 0)
+            if query_count > app.config['SQL_QUERY_WARN_THRESHOLD']:
+                app.logger.warning('%s %s issued %d SQL statements', request.method, request.path, query_count)
+            return response
     
     # Import models to ensure they're registered with SQLAlchemy
     from app.models import (
@@ -22,6 +68,13 @@ def create_app(config_name='default'):
         ActivityType, InternalActivityType, ProjectActivityType,
         AbsenceRequestType, AbsenceRequestStatus, TimesheetStatus
     )
+    # Configure all mappers (and their backrefs) now instead of on the first query of a request
+    configure_mappers()
+
+    # Opt-in schema creation at startup (e.g. throwaway containers), normally done by `init-db`
+    if os.environ.get('FLASK_INIT_DB') == '1':
+        with app.app_context():
+            db.create_all()
     
     # Register blueprints
     from app.routes import (
@@ -46,23 +99,11 @@ def create_app(config_name='default'):
         db.session.rollback()
         return jsonify({'error': 'Internal server error'}), 500
     
-    # Create database tables
-    with app.app_context():
+    # Database tables are created once at deploy time: `flask --app app init-db`
+    @app.cli.command('init-db')
+    def init_db():
+        """Create all database tables"""
         db.create_all()
-        '''
-        # Lightweight migration: ensure MonthlyTimesheet.status column exists (for SQLite)
-        try:
-            from sqlalchemy import text
-            result = db.session.execute(text("PRAGMA table_info('monthly_timesheet')")).fetchall()
-            column_names = {row[1] for row in result}
-            if 'status' not in column_names:
-                db.session.execute(text("ALTER TABLE monthly_timesheet ADD COLUMN status VARCHAR(50) NOT NULL DEFAULT 'pending'"))
-                db.session.execute(text("ALTER TABLE monthly_timesheet ADD COLUMN absence_type VARCHAR(50) NOT NULL DEFAULT 'absence'"))
-                db.session.execute(text("ALTER TABLE monthly_timesheet ADD COLUMN internal_activity_type VARCHAR(50) NOT NULL DEFAULT 'internal'"))
-                db.session.execute(text("ALTER TABLE monthly_timesheet ADD COLUMN project_activity_type VARCHAR(50) NOT NULL DEFAULT 'project'"))
-                db.session.execute(text("ALTER TABLE monthly_timesheet ADD COLUMN absence_request_id INTEGER REFERENCES absence_request(id)"))
-                db.session.commit()
-        except Exception:
-            db.session.rollback()
-        '''
+        click.echo('Database tables created')
+
     return app
\ No newline at end of file
@@ -1,6 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from flask_caching import Cache
 
 # Initialize extensions
 db = SQLAlchemy()
-cors = CORS()
\ No newline at end of file
+cors = CORS()
+cache = Cache()
\ No newline at end of file
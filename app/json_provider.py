@@ -0,0 +1,17 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson (dates, datetimes and enums are serialized natively)"""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        # Types orjson does not know (Decimal, UUID, ...) fall back to Flask's default handler
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
\ No newline at end of file
@@ -1,5 +1,8 @@
 from .enums import (ActivityType, InternalActivityType, ProjectActivityType,
-                   AbsenceRequestType, AbsenceRequestStatus, TimesheetStatus, AstreinteLocation, AstreinteType)
+                   AbsenceRequestType, AbsenceRequestStatus, TimesheetStatus, AstreinteLocation, AstreinteType,
+                   ACTIVITY_TYPE_BY_VALUE, INTERNAL_ACTIVITY_TYPE_BY_VALUE, PROJECT_ACTIVITY_TYPE_BY_VALUE,
+                   ASTREINTE_LOCATION_BY_VALUE, ASTREINTE_TYPE_BY_VALUE, ABSENCE_REQUEST_TYPE_BY_VALUE,
+                   ABSENCE_REQUEST_STATUS_BY_VALUE, TIMESHEET_STATUS_BY_VALUE, lookup_enum)
 from .consultant import Consultant
 from .project import Project
 from .project_assignment import ProjectAssignment
@@ -10,5 +13,8 @@ __all__ = [
     'ActivityType', 'InternalActivityType', 'ProjectActivityType',
     'AbsenceRequestType', 'AbsenceRequestStatus', 'TimesheetStatus',
     'Consultant', 'Project', 'ProjectAssignment', 'MonthlyTimesheet', 'DailyTimesheetEntry',
-    'AbsenceRequest', 'AbsenceRequestDay', 'AstreinteLocation', 'AstreinteType'
+    'AbsenceRequest', 'AbsenceRequestDay', 'AstreinteLocation', 'AstreinteType',
+    'ACTIVITY_TYPE_BY_VALUE', 'INTERNAL_ACTIVITY_TYPE_BY_VALUE', 'PROJECT_ACTIVITY_TYPE_BY_VALUE',
+    'ASTREINTE_LOCATION_BY_VALUE', 'ASTREINTE_TYPE_BY_VALUE', 'ABSENCE_REQUEST_TYPE_BY_VALUE',
+    'ABSENCE_REQUEST_STATUS_BY_VALUE', 'TIMESHEET_STATUS_BY_VALUE', 'lookup_enum'
 ]
\ No newline at end of file
@@ -27,6 +27,10 @@ class AbsenceRequest(db.Model):
     absence_days = db.relationship('AbsenceRequestDay', backref='absence_request', lazy=True, cascade='all, delete-orphan')
     daily_timesheet_entries = db.relationship('DailyTimesheetEntry', backref='related_absence_request', lazy=True, cascade='all, delete-orphan')
 
+    __table_args__ = (
+        db.Index('idx_absence_request_consultant_type', 'consultant_id', 'absence_type'),
+    )
+
 
 class AbsenceRequestDay(db.Model):
     """Individual days within an absence request"""
@@ -41,5 +45,6 @@ class AbsenceRequestDay(db.Model):
     # Unique constraint to prevent duplicate absence requests for the same day
     __table_args__ = (
         db.UniqueConstraint('absence_request_id', 'absence_date', name='unique_absence_day'),
-        db.Index('idx_consultant_date', 'absence_date')
+        db.Index('idx_consultant_date', 'absence_date'),
+        db.Index('idx_absence_day_consultant_date_status', 'consultant_id', 'absence_date', 'status')
     )
@@ -44,3 +44,20 @@ class TimesheetStatus(Enum):
     PENDING = "pending"
     VALIDATED = "validated"
     REFUSED = "refused"
+
+
+# Value -> member maps built once at import, used to parse request payloads
+ACTIVITY_TYPE_BY_VALUE = {e.value: e for e in ActivityType}
+INTERNAL_ACTIVITY_TYPE_BY_VALUE = {e.value: e for e in InternalActivityType}
+PROJECT_ACTIVITY_TYPE_BY_VALUE = {e.value: e for e in ProjectActivityType}
+ASTREINTE_LOCATION_BY_VALUE = {e.value: e for e in AstreinteLocation}
+ASTREINTE_TYPE_BY_VALUE = {e.value: e for e in AstreinteType}
+ABSENCE_REQUEST_TYPE_BY_VALUE = {e.value: e for e in AbsenceRequestType}
+ABSENCE_REQUEST_STATUS_BY_VALUE = {e.value: e for e in AbsenceRequestStatus}
+TIMESHEET_STATUS_BY_VALUE = {e.value: e for e in TimesheetStatus}
+
+def lookup_enum(members_by_value, value):
+    """Return the enum member for value, or None if value is not a valid enum value"""
+    if not isinstance(value, str):
+        return None
+    return members_by_value.get(value)
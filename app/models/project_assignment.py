@@ -13,6 +13,9 @@ class ProjectAssignment(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     
     # Unique constraint to prevent duplicate assignments
-    __table_args__ = (db.UniqueConstraint('consultant_id', 'project_id', name='unique_assignment'),)
+    __table_args__ = (
+        db.UniqueConstraint('consultant_id', 'project_id', name='unique_assignment'),
+        db.Index('idx_assignment_consultant_active', 'consultant_id', 'is_active')
+    )
 
     daily_timesheet_entries = db.relationship('DailyTimesheetEntry', backref='project_assignment', lazy=True)
\ No newline at end of file
@@ -66,6 +66,12 @@ class DailyTimesheetEntry(db.Model):
     astreinte_location = db.Column(db.Enum(AstreinteLocation), nullable=True)
     astreinte_type = db.Column(db.Enum(AstreinteType), nullable=True)
 
+    # Indexes for the per-consultant date lookups and per-mission filters
+    __table_args__ = (
+        db.Index('idx_daily_entry_consultant_date', 'consultant_id', 'work_date'),
+        db.Index('idx_daily_entry_mission', 'mission_id'),
+    )
+
     '''
     # Unique constraint to prevent duplicate entries per date per consultant
     __table_args__ = (
@@ -1,12 +1,20 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, abort
 from datetime import datetime, date
 import calendar  # noqa: F401
 from app.extensions import db
 from app.models import (Consultant, AbsenceRequest, AbsenceRequestDay,
-                       AbsenceRequestType, AbsenceRequestStatus, MonthlyTimesheet, DailyTimesheetEntry, ProjectAssignment, ActivityType)  # noqa: F401
+                       AbsenceRequestType, AbsenceRequestStatus, MonthlyTimesheet, DailyTimesheetEntry, ProjectAssignment, ActivityType,
+                       ACTIVITY_TYPE_BY_VALUE, ABSENCE_REQUEST_TYPE_BY_VALUE, ABSENCE_REQUEST_STATUS_BY_VALUE, lookup_enum)  # noqa: F401
 
 absence_requests_bp = Blueprint('absence_requests', __name__)
 
+# Day statuses that count towards the daily and annual absence limits
+ACTIVE_DAY_STATUSES = (AbsenceRequestStatus.PENDING, AbsenceRequestStatus.ACCEPTED, AbsenceRequestStatus.SAVED)
+# Day statuses counted by the annual limit check of update_absence_request
+SUBMITTED_DAY_STATUSES = (AbsenceRequestStatus.ACCEPTED, AbsenceRequestStatus.PENDING)
+# Statuses an absence request can be created with, updated from or updated to
+EDITABLE_STATUSES = (AbsenceRequestStatus.SAVED, AbsenceRequestStatus.PENDING, AbsenceRequestStatus.REFUSED, AbsenceRequestStatus.ACCEPTED)
+
 @absence_requests_bp.route('/api/absence-requests', methods=['POST'])
 def create_absence_request():
     """Create a new absence request with multiple days""" 
@@ -17,33 +25,34 @@ def create_absence_request():
         if not data or field not in data:
             return jsonify({'error': f'{field} is required'}), 400
      
-    # Validate consultant exists
-    consultant = Consultant.query.get_or_404(data['consultant_id'])
+    # Validate consultant exists (existence probe only, the row itself is not needed)
+    if db.session.query(Consultant.id).filter_by(id=data['consultant_id']).scalar() is None:
+        abort(404)
      
     # Validate absence type
-    try:
-        absence_type = AbsenceRequestType(data['absence_type'])
-    except ValueError: 
+    absence_type = lookup_enum(ABSENCE_REQUEST_TYPE_BY_VALUE, data['absence_type'])
+    if absence_type is None: 
         return jsonify({'error': 'Invalid absence type'}), 400
 
     # Validate activity type 
-    try: 
-        activity_type = ActivityType(data['activity_type']) 
-    except ValueError: 
+    activity_type = lookup_enum(ACTIVITY_TYPE_BY_VALUE, data['activity_type']) 
+    if activity_type is None: 
         return jsonify({'error': 'Invalid activity type'}), 400
      
     # Validate days data 
     if not data['days'] or not isinstance(data['days'], list): 
         return jsonify({'error': 'days must be a non-empty list'}), 400 
      
-    # Parse and validate each day 
+    # Parse and validate each day, collecting the dates and total hours in the same pass 
     parsed_days = [] 
+    requested_dates = []
+    total_hours_requested = 0
     for day_data in data['days']: 
         if not isinstance(day_data, dict) or 'date' not in day_data or 'number_of_hours' not in day_data: 
             return jsonify({'error': 'Each day must have date and number_of_hours'}), 400 
          
         try: 
-            absence_date = datetime.strptime(day_data['date'], '%Y-%m-%d').date() 
+            absence_date = date.fromisoformat(day_data['date']) 
         except ValueError: 
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400 
          
@@ -55,16 +64,22 @@ def create_absence_request():
             'date': absence_date, 
             'number_of_hours': number_of_hours 
         }) 
+        requested_dates.append(absence_date)
+        total_hours_requested += number_of_hours
      
     # Check for conflicts with existing absence requests (total hours per day must not exceed 8)
+    # Hours already requested on each of the requested days, in one grouped query
+    existing_hours_by_date = dict(db.session.query(
+        AbsenceRequestDay.absence_date, db.func.sum(AbsenceRequestDay.number_of_hours)
+    ).filter(
+        AbsenceRequestDay.consultant_id == data['consultant_id'],
+        AbsenceRequestDay.absence_date.in_(requested_dates),
+        AbsenceRequestDay.status.in_(ACTIVE_DAY_STATUSES)
+    ).group_by(AbsenceRequestDay.absence_date).all())
+
     daily_conflicts = []
     for day in parsed_days:
-        # Get total hours already requested for this day
-        existing_hours = db.session.query(db.func.sum(AbsenceRequestDay.number_of_hours)).join(AbsenceRequest).filter(
-            AbsenceRequest.consultant_id == data['consultant_id'],
-            AbsenceRequestDay.absence_date == day['date'],
-            AbsenceRequestDay.status.in_([AbsenceRequestStatus.PENDING, AbsenceRequestStatus.ACCEPTED, AbsenceRequestStatus.SAVED])
-        ).scalar() or 0
+        existing_hours = existing_hours_by_date.get(day['date']) or 0
         
         # Check if adding new hours would exceed 8 hours
         if existing_hours + day['number_of_hours'] > 8.0001:  # Small tolerance for floating point
@@ -87,13 +102,13 @@ def create_absence_request():
     # Check annual limit (excluding Congés Sans Solde) 
     if absence_type != AbsenceRequestType.CONGES_SANS_SOLDE: 
         current_year = datetime.now().year 
-        total_hours_requested = sum(day['number_of_hours'] for day in parsed_days) 
          
         existing_hours = db.session.query(db.func.sum(AbsenceRequestDay.number_of_hours)).join(AbsenceRequest).filter( 
             AbsenceRequest.consultant_id == data['consultant_id'], 
             AbsenceRequest.absence_type != AbsenceRequestType.CONGES_SANS_SOLDE, 
-            AbsenceRequestDay.status.in_([AbsenceRequestStatus.ACCEPTED, AbsenceRequestStatus.PENDING, AbsenceRequestStatus.SAVED]), 
-            db.func.strftime('%Y', AbsenceRequestDay.absence_date) == str(current_year) 
+            AbsenceRequestDay.status.in_(ACTIVE_DAY_STATUSES), 
+            AbsenceRequestDay.absence_date >= date(current_year, 1, 1), 
+            AbsenceRequestDay.absence_date < date(current_year + 1, 1, 1) 
         ).scalar() or 0 
          
         total_remaining_hours = max(0, 25 * 8 - existing_hours)
@@ -110,27 +125,24 @@ def create_absence_request():
         if not data.get('mission_id'): 
             return jsonify({'error': 'Mission Id is required!'}), 400 
          
-        # Validate mission exists and consultant is assigned 
-        assignment = ProjectAssignment.query.get_or_404(data['mission_id']) 
+        # Validate mission exists and consultant is assigned (only the id and owner columns are needed)
+        mission = db.session.query(ProjectAssignment.id, ProjectAssignment.consultant_id).filter_by(id=data['mission_id']).first()
+        if mission is None:
+            abort(404)
          
-        if assignment.consultant_id != data['consultant_id']: 
+        if mission.consultant_id != data['consultant_id']: 
             return jsonify({'error': 'Consultant is not assigned to this mission'}), 400
          
-        assigned_project_id = assignment.id
+        # Stored as the database id, not the raw payload value (which may be a numeric string)
+        assigned_project_id = mission.id
      
     # Status config (default Saved)
     status_value = data.get('status', AbsenceRequestStatus.SAVED.value)
-    try:
-        status = AbsenceRequestStatus(status_value)
-    except ValueError:
+    status = lookup_enum(ABSENCE_REQUEST_STATUS_BY_VALUE, status_value)
+    if status is None:
         return jsonify({'error': "Invalid status. Allowed: saved, pending, refused, accepted"}), 400
 
-    if status not in [
-        AbsenceRequestStatus.SAVED,
-        AbsenceRequestStatus.PENDING,
-        AbsenceRequestStatus.REFUSED,
-        AbsenceRequestStatus.ACCEPTED
-    ]:
+    if status not in EDITABLE_STATUSES:
         return jsonify({'error': "Status must be saved, pending, refused, or accepted for updates"}), 400
 
 
@@ -148,16 +160,14 @@ def create_absence_request():
         db.session.add(absence_request)
         db.session.flush()  # Get the ID
          
-        # Create absence days
-        for day in parsed_days:
-            absence_day = AbsenceRequestDay(
-                absence_request_id=absence_request.id,
-                consultant_id=data['consultant_id'],
-                status=status,
-                absence_date=day['date'],
-                number_of_hours=day['number_of_hours']
-            )
-            db.session.add(absence_day)
+        # Create absence days with a single executemany INSERT
+        db.session.execute(AbsenceRequestDay.__table__.insert(), [{
+            'absence_request_id': absence_request.id,
+            'consultant_id': data['consultant_id'],
+            'status': status,
+            'absence_date': day['date'],
+            'number_of_hours': day['number_of_hours']
+        } for day in parsed_days])
          
         db.session.commit()
 
@@ -168,12 +178,12 @@ def create_absence_request():
             'status': absence_request.status.value,
             'commentary': absence_request.commentary,
             'justification': absence_request.justification,
-            'total_hours': sum(day['number_of_hours'] for day in parsed_days),
+            'total_hours': total_hours_requested,
             'days': [{
-                'date': day['date'].isoformat(),
+                'date': day['date'],
                 'number_of_hours': day['number_of_hours']
             } for day in parsed_days],
-            'created_at': absence_request.created_at.isoformat(),
+            'created_at': absence_request.created_at,
         }), 201
         
     except Exception as e:
@@ -476,12 +486,7 @@ def update_absence_request(request_id):
     absence_request = AbsenceRequest.query.get_or_404(request_id)
 
     # Only saved, pending, refused, or accepted requests can be updated
-    if absence_request.status not in [
-        AbsenceRequestStatus.SAVED,
-        AbsenceRequestStatus.PENDING,
-        AbsenceRequestStatus.REFUSED,
-        AbsenceRequestStatus.ACCEPTED
-    ]:
+    if absence_request.status not in EDITABLE_STATUSES:
         return jsonify({'error': 'Only saved, pending, refused, or accepted requests can be updated'}), 400
 
     '''
@@ -498,11 +503,19 @@ def update_absence_request(request_id):
 
     # Absence type can be updated
     absence_type_value = data.get('absence_type', absence_request.absence_type.value)
-    try:
-        new_absence_type = AbsenceRequestType(absence_type_value)
-    except ValueError:
+    new_absence_type = lookup_enum(ABSENCE_REQUEST_TYPE_BY_VALUE, absence_type_value)
+    if new_absence_type is None:
         return jsonify({'error': 'Invalid absence type'}), 400
 
+    # Status update (default Saved), validated before any query or change to the request
+    new_status_value = data.get('status', AbsenceRequestStatus.SAVED.value)
+    new_status = lookup_enum(ABSENCE_REQUEST_STATUS_BY_VALUE, new_status_value)
+    if new_status is None:
+        return jsonify({'error': "Invalid status. Allowed: saved, pending, refused, accepted"}), 400
+
+    if new_status not in EDITABLE_STATUSES:
+        return jsonify({'error': "Status must be saved, pending, refused, or accepted for updates"}), 400
+
     '''
     # 🟦 Activity type and mission verification
     assigned_project_id = None
@@ -544,7 +557,7 @@ def update_absence_request(request_id):
                 return jsonify({'error': 'Each day must have date and number_of_hours'}), 400
 
             try:
-                absence_date = datetime.strptime(day_data['date'], '%Y-%m-%d').date()
+                absence_date = date.fromisoformat(day_data['date'])
             except ValueError:
                 return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
 
@@ -555,19 +568,19 @@ def update_absence_request(request_id):
             parsed_days.append({'date': absence_date, 'number_of_hours': number_of_hours})
 
         # Conflict validation (total hours per day must not exceed 8)
+        # Hours already requested on each day by other requests, in one grouped query
+        existing_hours_by_date = dict(db.session.query(
+            AbsenceRequestDay.absence_date, db.func.sum(AbsenceRequestDay.number_of_hours)
+        ).filter(
+            AbsenceRequestDay.consultant_id == absence_request.consultant_id,
+            AbsenceRequestDay.absence_date.in_([day['date'] for day in parsed_days]),
+            AbsenceRequestDay.status.in_(ACTIVE_DAY_STATUSES),
+            AbsenceRequestDay.absence_request_id != absence_request.id
+        ).group_by(AbsenceRequestDay.absence_date).all())
+
         daily_conflicts = []
         for day in parsed_days:
-            # Get total hours already requested for this day (excluding current request)
-            existing_hours = db.session.query(db.func.sum(AbsenceRequestDay.number_of_hours)).join(AbsenceRequest).filter(
-                AbsenceRequest.consultant_id == absence_request.consultant_id,
-                AbsenceRequestDay.absence_date == day['date'],
-                AbsenceRequestDay.status.in_([
-                    AbsenceRequestStatus.PENDING,
-                    AbsenceRequestStatus.ACCEPTED,
-                    AbsenceRequestStatus.SAVED
-                ]),
-                AbsenceRequestDay.absence_request_id != absence_request.id
-            ).scalar() or 0
+            existing_hours = existing_hours_by_date.get(day['date']) or 0
             
             # Check if adding new hours would exceed 8 hours
             if existing_hours + day['number_of_hours'] > 8.0001:  # Small tolerance for floating point
@@ -588,16 +601,14 @@ def update_absence_request(request_id):
             }), 400
         # Annual limit check
         if new_absence_type != AbsenceRequestType.CONGES_SANS_SOLDE:
-            current_year = datetime.now().year
             total_hours_requested = sum(day['number_of_hours'] for day in parsed_days)
+            current_year = datetime.now().year
             existing_hours = db.session.query(db.func.sum(AbsenceRequestDay.number_of_hours)).join(AbsenceRequest).filter(
                 AbsenceRequest.consultant_id == absence_request.consultant_id,
                 AbsenceRequest.absence_type != AbsenceRequestType.CONGES_SANS_SOLDE,
-                AbsenceRequestDay.status.in_([
-                    AbsenceRequestStatus.ACCEPTED,
-                    AbsenceRequestStatus.PENDING
-                ]),
-                db.func.strftime('%Y', AbsenceRequestDay.absence_date) == str(current_year),
+                AbsenceRequestDay.status.in_(SUBMITTED_DAY_STATUSES),
+                AbsenceRequestDay.absence_date >= date(current_year, 1, 1),
+                AbsenceRequestDay.absence_date < date(current_year + 1, 1, 1),
                 AbsenceRequestDay.absence_request_id != absence_request.id
             ).scalar() or 0
 
@@ -613,37 +624,35 @@ def update_absence_request(request_id):
         absence_request.commentary = new_commentary
         absence_request.justification = new_justification
         #absence_request.assigned_project_id = assigned_project_id
-
-        # Status update (default Saved)
-        new_status_value = data.get('status', AbsenceRequestStatus.SAVED.value)
-        try:
-            new_status = AbsenceRequestStatus(new_status_value)
-        except ValueError:
-            return jsonify({'error': "Invalid status. Allowed: saved, pending, refused, accepted"}), 400
-
-        if new_status not in [
-            AbsenceRequestStatus.SAVED,
-            AbsenceRequestStatus.PENDING,
-            AbsenceRequestStatus.REFUSED,
-            AbsenceRequestStatus.ACCEPTED
-        ]:
-            return jsonify({'error': "Status must be saved, pending, refused, or accepted for updates"}), 400
-
         absence_request.status = new_status
 
-        # Replace days if provided
+        # Replace days if provided, only writing the days that actually changed
         if parsed_days is not None:
-            # Delete all daily absence request records
-            AbsenceRequestDay.query.filter_by(absence_request_id=absence_request.id).delete()
-            
+            existing_days = {d.absence_date: d for d in absence_request.absence_days}
+
+            new_rows = []
             for day in parsed_days:
-                db.session.add(AbsenceRequestDay(
-                    absence_request_id=absence_request.id,
-                    consultant_id=absence_request.consultant_id,
-                    absence_date=day['date'],
-                    number_of_hours=day['number_of_hours'],
-                    status=new_status
+                existing_day = existing_days.pop(day['date'], None)
+                if existing_day is None:
+                    new_rows.append({
+                        'absence_request_id': absence_request.id,
+                        'consultant_id': absence_request.consultant_id,
+                        'absence_date': day['date'],
+                        'number_of_hours': day['number_of_hours'],
+                        'status': new_status
+                    })
+                else:
+                    # Unchanged values are not part of the UPDATE issued at flush
+                    existing_day.number_of_hours = day['number_of_hours']
+                    existing_day.status = new_status
+
+            # Days no longer in the request
+            if existing_days:
+                db.session.execute(AbsenceRequestDay.__table__.delete().where(
+                    AbsenceRequestDay.id.in_([d.id for d in existing_days.values()])
                 ))
+            if new_rows:
+                db.session.execute(AbsenceRequestDay.__table__.insert(), new_rows)
 
         db.session.commit()
 
@@ -658,7 +667,7 @@ def update_absence_request(request_id):
             'justification': absence_request.justification,
             'days': [
                 {
-                    'date': d.absence_date.isoformat(),
+                    'date': d.absence_date,
                     'number_of_hours': d.number_of_hours
                 } for d in absence_request.absence_days
             ]
@@ -872,7 +881,7 @@ def review_absence_request(request_id):
 
 @absence_requests_bp.route('/api/absence-requests/<int:request_id>', methods=['DELETE'])
 def delete_absence_request(request_id):
-    """Delete an absence request only if it's pending. Related timesheet entries and child days are removed via cascade delete-orphan."""
+    """Delete an absence request only if it's pending. Related timesheet entries and child days are removed with it."""
     absence_request = AbsenceRequest.query.get_or_404(request_id)
 
     data = request.get_json(silent=True) or {}
@@ -889,8 +898,15 @@ def delete_absence_request(request_id):
     '''
     
     try:
-        # Delete the absence request (this will cascade delete related timesheet entries and absence days)
-        db.session.delete(absence_request)
+        # Delete the related timesheet entries and absence days in one statement each, then the request,
+        # instead of letting the ORM cascade load every child row and delete them one by one
+        db.session.execute(DailyTimesheetEntry.__table__.delete().where(
+            DailyTimesheetEntry.absence_request_id == request_id
+        ))
+        db.session.execute(AbsenceRequestDay.__table__.delete().where(
+            AbsenceRequestDay.absence_request_id == request_id
+        ))
+        db.session.execute(AbsenceRequest.__table__.delete().where(AbsenceRequest.id == request_id))
         db.session.commit()
         
         return jsonify({
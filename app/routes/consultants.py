@@ -1,9 +1,15 @@
-from flask import Blueprint, request, jsonify
-from app.extensions import db
+from flask import Blueprint, request, jsonify, abort
+from app.extensions import db, cache
 from app.models import Consultant, ProjectAssignment, Project
 
 consultants_bp = Blueprint('consultants', __name__)
 
+def consultant_projects_cache_key(consultant_id=None):
+    """Cache key of get_consultant_projects for a consultant (defaults to the current request's)"""
+    if consultant_id is None:
+        consultant_id = request.view_args['consultant_id']
+    return f'consultant_projects_{consultant_id}'
+
 @consultants_bp.route('/api/consultants', methods=['POST'])
 def create_consultant():
     """Create a new consultant"""
@@ -25,6 +31,7 @@ def create_consultant():
     try:
         db.session.add(consultant)
         db.session.commit()
+        cache.delete('consultants_all')
         return jsonify({
             'id': consultant.id,
             'name': consultant.name,
@@ -35,6 +42,7 @@ def create_consultant():
         return jsonify({'error': 'Failed to create consultant'}), 500
 
 @consultants_bp.route('/api/consultants', methods=['GET'])
+@cache.cached(timeout=60, key_prefix='consultants_all')
 def get_consultants():
     """Get all consultants"""
     consultants = Consultant.query.all()
@@ -42,13 +50,16 @@ def get_consultants():
         'id': c.id,
         'name': c.name,
         'email': c.email,
-        'created_at': c.created_at.isoformat()
+        'created_at': c.created_at
     } for c in consultants])
 
 @consultants_bp.route('/api/consultants/<int:consultant_id>/projects', methods=['GET'])
+@cache.cached(timeout=60, key_prefix=consultant_projects_cache_key)
 def get_consultant_projects(consultant_id):
     """Get all active projects assigned to a consultant"""
-    consultant = Consultant.query.get_or_404(consultant_id)
+    # Existence probe only, the consultant row itself is not needed
+    if db.session.query(Consultant.id).filter_by(id=consultant_id).scalar() is None:
+        abort(404)
     
     assignments = db.session.query(ProjectAssignment, Project).join(Project).filter(
         ProjectAssignment.consultant_id == consultant_id,
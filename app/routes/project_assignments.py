@@ -1,7 +1,9 @@
-from flask import Blueprint, request, jsonify
-from datetime import datetime
-from app.extensions import db
+from flask import Blueprint, request, jsonify, abort
+from datetime import datetime, date
+from sqlalchemy.orm import selectinload, raiseload
+from app.extensions import db, cache
 from app.models import Consultant, Project, ProjectAssignment
+from app.routes.consultants import consultant_projects_cache_key
 
 project_assignments_bp = Blueprint('project_assignments', __name__)
 
@@ -11,8 +13,12 @@ def get_project_assignments():
     consultant_id = request.args.get('consultant_id', type=int)
     project_id = request.args.get('project_id', type=int)
     
-    # Build query based on filters
-    query = ProjectAssignment.query
+    # Build query based on filters, loading consultants and projects in one extra query each
+    query = ProjectAssignment.query.options(
+        selectinload(ProjectAssignment.consultant),
+        selectinload(ProjectAssignment.project),
+        raiseload('*')
+    )
     
     if consultant_id:
         query = query.filter_by(consultant_id=consultant_id)
@@ -32,9 +38,9 @@ def get_project_assignments():
         'client_company': assignment.project.client_company,
         'position': assignment.position,
         'is_active': assignment.is_active,
-        'assigned_at': assignment.assigned_at.isoformat(),
-        'starts_at': assignment.starts_at.isoformat(),
-        'ends_at': assignment.ends_at.isoformat()
+        'assigned_at': assignment.assigned_at,
+        'starts_at': assignment.starts_at,
+        'ends_at': assignment.ends_at
     } for assignment in assignments]), 200
 
 
@@ -48,14 +54,16 @@ def assign_consultant_to_project():
         if not data or field not in data:
             return jsonify({'error': f'{field} is required'}), 400
     
-    # Validate consultant and project exist
-    consultant = Consultant.query.get_or_404(data['consultant_id'])
+    # Validate consultant and project exist (only the consultant's name is needed)
+    consultant_name = db.session.query(Consultant.name).filter_by(id=data['consultant_id']).scalar()
+    if consultant_name is None:
+        abort(404)
     project = Project.query.get_or_404(data['project_id'])
 
     # Validate starts_at and ends_at
     try:
-        starts_at = datetime.strptime(data['starts_at'], '%Y-%m-%d').date()
-        ends_at = datetime.strptime(data['ends_at'], '%Y-%m-%d').date()
+        starts_at = date.fromisoformat(data['starts_at'])
+        ends_at = date.fromisoformat(data['ends_at'])
     except ValueError:
         return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
 
@@ -94,17 +102,18 @@ def assign_consultant_to_project():
     
     try:
         db.session.commit()
+        cache.delete(consultant_projects_cache_key(assignment.consultant_id))
         return jsonify({
             'id': assignment.id,
             'consultant_id': assignment.consultant_id,
-            'consultant_name': consultant.name,
+            'consultant_name': consultant_name,
             'project_id': assignment.project_id,
             'project_name': project.name,
             'position': assignment.position,
             'is_active': assignment.is_active,
-            'assigned_at': assignment.assigned_at.isoformat(),
-            'starts_at': assignment.starts_at.isoformat(),
-            'ends_at': assignment.ends_at.isoformat()
+            'assigned_at': assignment.assigned_at,
+            'starts_at': assignment.starts_at,
+            'ends_at': assignment.ends_at
         }), 201
     except Exception as e:
         db.session.rollback()
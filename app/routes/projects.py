@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import date
 from flask import Blueprint, request, jsonify
-from app.extensions import db
+from app.extensions import db, cache
 from app.models import Project
 
 projects_bp = Blueprint('projects', __name__)
@@ -17,8 +17,8 @@ def create_project():
     
     # Validate starts_at and ends_at
     try:
-        starts_at = datetime.strptime(data['starts_at'], '%Y-%m-%d').date()
-        ends_at = datetime.strptime(data['ends_at'], '%Y-%m-%d').date()
+        starts_at = date.fromisoformat(data['starts_at'])
+        ends_at = date.fromisoformat(data['ends_at'])
     except ValueError:
         return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
     
@@ -34,6 +34,7 @@ def create_project():
     try:
         db.session.add(project)
         db.session.commit()
+        cache.delete('projects_active')
         return jsonify({
             'id': project.id,
             'name': project.name,
@@ -41,14 +42,15 @@ def create_project():
             'represented_by': project.represented_by,
             'supervisor_email': project.supervisor_email,
             'is_active': project.is_active,
-            'starts_at': project.starts_at.isoformat(),
-            'ends_at': project.ends_at.isoformat()
+            'starts_at': project.starts_at,
+            'ends_at': project.ends_at
         }), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': 'Failed to create project'}), 500
 
 @projects_bp.route('/api/projects', methods=['GET'])
+@cache.cached(timeout=60, key_prefix='projects_active')
 def get_projects():
     """Get all active projects"""
     projects = Project.query.filter_by(is_active=True).all()
@@ -58,7 +60,7 @@ def get_projects():
         'client_company': p.client_company,
         'represented_by': p.represented_by,
         'supervisor_email': p.supervisor_email,
-        'created_at': p.created_at.isoformat(),
-        'starts_at': p.starts_at.isoformat(),
-        'ends_at': p.ends_at.isoformat()
+        'created_at': p.created_at,
+        'starts_at': p.starts_at,
+        'ends_at': p.ends_at
     } for p in projects])
\ No newline at end of file
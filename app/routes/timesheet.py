@@ -1,56 +1,172 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, abort
 from datetime import datetime, date
 import calendar
+import hashlib
+from collections import defaultdict
+from sqlalchemy import func, case, and_, distinct, select
+from sqlalchemy.orm import selectinload, raiseload, defer
+from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.models import (Consultant, Project, ProjectAssignment, MonthlyTimesheet, DailyTimesheetEntry,
-                       ActivityType, InternalActivityType, AbsenceRequestType, ProjectActivityType, AstreinteLocation, AstreinteType, AbsenceRequestStatus, AbsenceRequestDay, AbsenceRequest, TimesheetStatus)
+                       ActivityType, ProjectActivityType, AstreinteLocation, AstreinteType, AbsenceRequestStatus, AbsenceRequestDay, AbsenceRequest, TimesheetStatus,
+                       ACTIVITY_TYPE_BY_VALUE, INTERNAL_ACTIVITY_TYPE_BY_VALUE, PROJECT_ACTIVITY_TYPE_BY_VALUE,
+                       ASTREINTE_LOCATION_BY_VALUE, ASTREINTE_TYPE_BY_VALUE, ABSENCE_REQUEST_TYPE_BY_VALUE,
+                       TIMESHEET_STATUS_BY_VALUE, lookup_enum)
 
 timesheet_bp = Blueprint('timesheet', __name__)
 
+# Maximum number of daily entries sent per executemany INSERT
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# calendar.month_name formats the name through strftime on every access, resolve it once
+MONTH_NAMES = tuple(calendar.month_name)
+
+
+def _parse_id(value):
+    """Return an id from the payload as an int (ids may be sent as numeric strings), or None if invalid"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().isdecimal():
+        return int(value)
+    return None
+
+def _check_mission(mission_id, date_str, consultant_id, mission_owners):
+    """Return an error response if the mission id is invalid, or the mission does not exist or is not the consultant's"""
+    mission_id = _parse_id(mission_id)
+    if mission_id is None:
+        return jsonify({'error': f'Invalid mission_id for {date_str}'}), 400
+    mission_owner = mission_owners.get(mission_id)
+    if mission_owner is None:
+        return jsonify({'error': f'Mission with id {mission_id} not found'}), 404
+    if mission_owner != consultant_id:
+        return jsonify({'error': f'Consultant not assigned to mission {mission_id}'}), 400
+    return None
+
+def _parse_project_activity(activity, date_str, consultant_id, mission_owners, absence_request_owners):
+    """Validate a PROJECT activity. Returns (entry fields, None) or (None, error response)"""
+    if not activity.get('mission_id'):
+        return None, (jsonify({'error': f'mission_id required for project activity on {date_str}'}), 400)
+    error = _check_mission(activity['mission_id'], date_str, consultant_id, mission_owners)
+    if error:
+        return None, error
+    mission_id = _parse_id(activity['mission_id'])
+
+    # Project activity type
+    mission_activity_type = lookup_enum(PROJECT_ACTIVITY_TYPE_BY_VALUE, activity.get('mission_activity_type', 'Normale'))
+    if mission_activity_type is None:
+        return None, (jsonify({'error': f'Invalid mission_activity_type for {date_str}'}), 400)
+
+    fields = {'mission_id': mission_id, 'mission_activity_type': mission_activity_type}
+    if mission_activity_type == ProjectActivityType.ASTREINTE:
+        if not activity.get('astreinte_location'):
+            return None, (jsonify({'error': f'astreinte_location is required for Astreinte on {date_str}'}), 400)
+        if not activity.get('astreinte_type'):
+            return None, (jsonify({'error': f'astreinte_type is required for Astreinte on {date_str}'}), 400)
+
+        fields['astreinte_location'] = lookup_enum(ASTREINTE_LOCATION_BY_VALUE, activity['astreinte_location'])
+        if fields['astreinte_location'] is None:
+            return None, (jsonify({'error': f'Invalid astreinte_location for {date_str}. Must be one of {[l.value for l in AstreinteLocation]}'}), 400)
+
+        fields['astreinte_type'] = lookup_enum(ASTREINTE_TYPE_BY_VALUE, activity['astreinte_type'])
+        if fields['astreinte_type'] is None:
+            return None, (jsonify({'error': f'Invalid astreinte_type for {date_str}. Must be one of {[t.value for t in AstreinteType]}'}), 400)
+
+    return fields, None
+
+def _parse_internal_activity(activity, date_str, consultant_id, mission_owners, absence_request_owners):
+    """Validate an INTERNAL activity. Returns (entry fields, None) or (None, error response)"""
+    if not activity.get('internal_activity_type'):
+        return None, (jsonify({'error': f'internal_activity_type required for internal activity on {date_str}'}), 400)
+    internal_activity_type = lookup_enum(INTERNAL_ACTIVITY_TYPE_BY_VALUE, activity['internal_activity_type'])
+    if internal_activity_type is None:
+        return None, (jsonify({'error': f'Invalid internal_activity_type for {date_str}'}), 400)
+    return {'internal_activity_type': internal_activity_type}, None
+
+def _parse_absence_activity(activity, date_str, consultant_id, mission_owners, absence_request_owners):
+    """Validate an ABSENCE activity. Returns (entry fields, None) or (None, error response)"""
+    # absence_type is required
+    if not activity.get('absence_type'):
+        return None, (jsonify({'error': f'absence_type required for absence activity on {date_str}'}), 400)
+    absence_type = lookup_enum(ABSENCE_REQUEST_TYPE_BY_VALUE, activity['absence_type'])
+    if absence_type is None:
+        return None, (jsonify({'error': f'Invalid absence_type for {date_str}'}), 400)
+
+    # absence_request_id is mandatory
+    if not activity.get('absence_request_id'):
+        return None, (jsonify({'error': f'absence_request_id required for absence activity on {date_str}'}), 400)
+    absence_request_id = _parse_id(activity['absence_request_id'])
+    if absence_request_id is None:
+        return None, (jsonify({'error': f'Invalid absence_request_id for {date_str}'}), 400)
+
+    absence_request_owner = absence_request_owners.get(absence_request_id)
+    if absence_request_owner is None:
+        return None, (jsonify({'error': f'Absence request with id {absence_request_id} not found'}), 404)
+    if absence_request_owner != consultant_id:
+        return None, (jsonify({'error': f'Absence request {absence_request_id} does not belong to consultant {consultant_id}'}), 400)
+
+    fields = {'absence_type': absence_type, 'absence_request_id': absence_request_id}
+
+    # mission_id is optional for absence
+    if activity.get('mission_id'):
+        error = _check_mission(activity['mission_id'], date_str, consultant_id, mission_owners)
+        if error:
+            return None, error
+        fields['mission_id'] = _parse_id(activity['mission_id'])
+
+    return fields, None
+
+# Type-specific validation for create_timesheet, dispatched on the activity type
+ACTIVITY_HANDLERS = {
+    ActivityType.PROJECT: _parse_project_activity,
+    ActivityType.INTERNAL: _parse_internal_activity,
+    ActivityType.ABSENCE: _parse_absence_activity,
+}
+
 # Load timesheet data (period, status, number of declared days, reviewed by, reviewed at, manager comments) for a given consultant
 @timesheet_bp.route('/api/consultant/<int:consultant_id>/timesheets', methods=['GET'])
 def get_timesheets_per_consultant(consultant_id):
     """Get timesheet data for a given consultant"""
-    consultant = Consultant.query.get_or_404(consultant_id)
+    if db.session.query(Consultant.id).filter_by(id=consultant_id).scalar() is None:
+        abort(404)
     result = []
 
-    monthly_timesheets = consultant.monthly_timesheets
-
-    for monthly_timesheet in monthly_timesheets:
+    # ---- One row per timesheet with its declared days and hours computed by the database ----
+    # Astreinte does not count toward the total hours
+    is_astreinte = and_(
+        DailyTimesheetEntry.activity_type == ActivityType.PROJECT,
+        DailyTimesheetEntry.mission_activity_type == ProjectActivityType.ASTREINTE
+    )
+    rows = db.session.query(
+        MonthlyTimesheet,
+        func.count(distinct(DailyTimesheetEntry.work_date)),
+        func.coalesce(func.sum(case((is_astreinte, 0.0), else_=DailyTimesheetEntry.number_of_hours)), 0.0),
+        func.coalesce(func.sum(case((DailyTimesheetEntry.activity_type == ActivityType.ABSENCE, DailyTimesheetEntry.number_of_hours), else_=0.0)), 0.0)
+    ).outerjoin(
+        DailyTimesheetEntry, DailyTimesheetEntry.monthly_timesheet_id == MonthlyTimesheet.id
+    ).filter(
+        MonthlyTimesheet.consultant_id == consultant_id
+    ).group_by(MonthlyTimesheet.id).all()
+
+    for monthly_timesheet, declared_days, total_hours, absence_hours in rows:
         one_monthly_timesheet = {}
 
         # Basic info
         one_monthly_timesheet['monthly_timesheet_id'] = monthly_timesheet.id
         one_monthly_timesheet['period'] = {
             'year': monthly_timesheet.year,
-            'month_name': calendar.month_name[monthly_timesheet.month]
+            'month_name': MONTH_NAMES[monthly_timesheet.month]
         }
         one_monthly_timesheet['status'] = monthly_timesheet.status.value if monthly_timesheet.status else None
-        one_monthly_timesheet['number_of_declared_days'] = len(set(entry.work_date for entry in monthly_timesheet.daily_entries))
+        one_monthly_timesheet['number_of_declared_days'] = declared_days
         one_monthly_timesheet['reviewed_by'] = monthly_timesheet.reviewed_by
         one_monthly_timesheet['reviewed_at'] = monthly_timesheet.reviewed_at
         one_monthly_timesheet['manager_comments'] = monthly_timesheet.manager_comments
 
         # ---- Calculate repartition ----
-        total_hours = 0.0
-        absence_hours = 0.0
-
-        for entry in monthly_timesheet.daily_entries:
-            # Skip astreinte from total hours
-            if (
-                entry.activity_type == ActivityType.PROJECT and
-                entry.mission_activity_type == ProjectActivityType.ASTREINTE
-            ):
-                continue
-
-            # Count toward total hours
-            total_hours += entry.number_of_hours or 0.0
-
-            # Count absence hours
-            if entry.activity_type == ActivityType.ABSENCE:
-                absence_hours += entry.number_of_hours or 0.0
-
-        # Compute repartition %
         repartition = (absence_hours / total_hours * 100) if total_hours > 0 else 0.0
         one_monthly_timesheet['repartition'] = round(100 - repartition, 1)  # e.g. 23.4
 
@@ -90,9 +206,8 @@ def create_timesheet():
         return jsonify({'error': 'work_dates must be an object'}), 400
 
     # Determine timesheet status
-    try:
-        status = TimesheetStatus(data.get('status', 'saved'))
-    except ValueError:
+    status = lookup_enum(TIMESHEET_STATUS_BY_VALUE, data.get('status', 'saved'))
+    if status is None:
         return jsonify({'error': 'Invalid status'}), 400
 
     # Create monthly timesheet
@@ -105,12 +220,38 @@ def create_timesheet():
     )
 
     db.session.add(monthly_timesheet)
-    db.session.flush()  # Get ID for foreign key
+    try:
+        db.session.flush()  # Get ID for foreign key, the consultant FK and unique month are checked here
+    except IntegrityError:
+        db.session.rollback()
+        # Either a concurrent request created this month's timesheet after the check above, or the consultant does not exist
+        if MonthlyTimesheet.query.filter_by(consultant_id=consultant_id, month=month, year=year).first():
+            return jsonify({'error': 'Timesheet for this month already exists for this consultant'}), 400
+        return jsonify({'error': f'Consultant with id {consultant_id} not found'}), 404
+
+    # Resolve every referenced mission and absence request up front (one IN query each)
+    referenced_activities = [
+        activity
+        for activities in work_dates.values() if isinstance(activities, list)
+        for activity in activities if isinstance(activity, dict)
+    ]
+    # Invalid ids are left out here and rejected with a 400 by the activity handlers
+    mission_ids = {_parse_id(a['mission_id']) for a in referenced_activities if a.get('mission_id')} - {None}
+    absence_request_ids = {_parse_id(a['absence_request_id']) for a in referenced_activities if a.get('absence_request_id')} - {None}
+    mission_owners = dict(db.session.query(ProjectAssignment.id, ProjectAssignment.consultant_id).filter(
+        ProjectAssignment.id.in_(mission_ids)
+    ).all()) if mission_ids else {}
+    absence_request_owners = dict(db.session.query(AbsenceRequest.id, AbsenceRequest.consultant_id).filter(
+        AbsenceRequest.id.in_(absence_request_ids)
+    ).all()) if absence_request_ids else {}
+
+    # Rows are validated first, then inserted in bulk
+    entry_rows = []
 
     # Iterate through each date in work_dates
     for date_str, activities in work_dates.items():
         try:
-            work_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            work_date = date.fromisoformat(date_str)
         except ValueError:
             return jsonify({'error': f'Invalid date format for {date_str}. Use YYYY-MM-DD'}), 400
 
@@ -123,9 +264,8 @@ def create_timesheet():
             if 'activity_type' not in activity or 'number_of_hours' not in activity:
                 return jsonify({'error': f'Missing required fields for {date_str}'}), 400
 
-            try:
-                activity_type = ActivityType(activity['activity_type'])
-            except ValueError:
+            activity_type = lookup_enum(ACTIVITY_TYPE_BY_VALUE, activity['activity_type'])
+            if activity_type is None:
                 return jsonify({'error': f'Invalid activity_type for {date_str}'}), 400
 
             number_of_hours = activity['number_of_hours']
@@ -137,107 +277,36 @@ def create_timesheet():
             if total_hours_day > 24:
                 return jsonify({'error': f'Total hours exceed 24 for {date_str}'}), 400
 
-            # Initialize optional fields
-            mission_id = None
-            mission_activity_type = None
-            astreinte_location = None
-            astreinte_type = None
-            internal_activity_type = None
-            absence_type = None
-            absence_request_id = None
-
-            # PROJECT activities validation
-            if activity_type == ActivityType.PROJECT:
-                if not activity.get('mission_id'):
-                    return jsonify({'error': f'mission_id required for project activity on {date_str}'}), 400
-                mission_id = activity['mission_id']
-                assignment = ProjectAssignment.query.get(mission_id)
-                if not assignment:
-                    return jsonify({'error': f'Mission with id {mission_id} not found'}), 404
-                if assignment.consultant_id != consultant_id:
-                    return jsonify({'error': f'Consultant not assigned to mission {mission_id}'}), 400
-
-                # Project activity type
-                try:
-                    mission_activity_type = ProjectActivityType(activity.get('mission_activity_type', 'Normale'))
-                except ValueError:
-                    return jsonify({'error': f'Invalid mission_activity_type for {date_str}'}), 400                
-
-                if mission_activity_type == ProjectActivityType.ASTREINTE:
-                    if not activity.get('astreinte_location'):
-                        return jsonify({'error': f'astreinte_location is required for Astreinte on {date_str}'}), 400
-                    if not activity.get('astreinte_type'):
-                        return jsonify({'error': f'astreinte_type is required for Astreinte on {date_str}'}), 400
-
-                    try:
-                        astreinte_location = AstreinteLocation(activity['astreinte_location'])
-                    except ValueError:
-                        return jsonify({'error': f'Invalid astreinte_location for {date_str}. Must be one of {[l.value for l in AstreinteLocation]}'}), 400
-
-                    try:
-                        astreinte_type = AstreinteType(activity['astreinte_type'])
-                    except ValueError:
-                        return jsonify({'error': f'Invalid astreinte_type for {date_str}. Must be one of {[t.value for t in AstreinteType]}'}), 400
-
-            # INTERNAL activities validation
-            elif activity_type == ActivityType.INTERNAL:
-                if not activity.get('internal_activity_type'):
-                    return jsonify({'error': f'internal_activity_type required for internal activity on {date_str}'}), 400
-                try:
-                    internal_activity_type = InternalActivityType(activity['internal_activity_type'])
-                except ValueError:
-                    return jsonify({'error': f'Invalid internal_activity_type for {date_str}'}), 400
-
-            # ABSENCE activities validation
-            elif activity_type == ActivityType.ABSENCE:
-                # absence_type is required
-                if not activity.get('absence_type'):
-                    return jsonify({'error': f'absence_type required for absence activity on {date_str}'}), 400
-                try:
-                    absence_type = AbsenceRequestType(activity['absence_type'])
-                except ValueError:
-                    return jsonify({'error': f'Invalid absence_type for {date_str}'}), 400
-
-                # absence_request_id is mandatory
-                if not activity.get('absence_request_id'):
-                    return jsonify({'error': f'absence_request_id required for absence activity on {date_str}'}), 400
-                absence_request_id = activity['absence_request_id']
-
-                absence_request = AbsenceRequest.query.get(absence_request_id)
-                if not absence_request:
-                    return jsonify({'error': f'Absence request with id {absence_request_id} not found'}), 404
-                if absence_request.consultant_id != consultant_id:
-                    return jsonify({'error': f'Absence request {absence_request_id} does not belong to consultant {consultant_id}'}), 400
-
-                # mission_id is optional for absence
-                if activity.get('mission_id'):
-                    mission_id = activity['mission_id']
-                    assignment = ProjectAssignment.query.get(mission_id)
-                    if not assignment:
-                        return jsonify({'error': f'Mission with id {mission_id} not found'}), 404
-                    if assignment.consultant_id != consultant_id:
-                        return jsonify({'error': f'Consultant not assigned to mission {mission_id}'}), 400
+            # Validate the type-specific fields (mission, internal activity or absence)
+            fields, error = ACTIVITY_HANDLERS[activity_type](
+                activity, date_str, consultant_id, mission_owners, absence_request_owners
+            )
+            if error:
+                return error
 
             # Create daily entry
-            daily_entry = DailyTimesheetEntry(
-                monthly_timesheet_id=monthly_timesheet.id,
-                consultant_id=consultant_id,
-                work_date=work_date,
-                activity_type=activity_type,
-                number_of_hours=number_of_hours,
-                mission_id=mission_id,
-                mission_activity_type=mission_activity_type,
-                internal_activity_type=internal_activity_type,
-                absence_type=absence_type,
-                absence_request_id=absence_request_id,
-                astreinte_location=astreinte_location,
-                astreinte_type=astreinte_type,
-                description=activity.get('description'),
-                status=status
-            )
-            db.session.add(daily_entry)
+            entry_rows.append({
+                'monthly_timesheet_id': monthly_timesheet.id,
+                'consultant_id': consultant_id,
+                'work_date': work_date,
+                'activity_type': activity_type,
+                'number_of_hours': number_of_hours,
+                'mission_id': None,
+                'mission_activity_type': None,
+                'internal_activity_type': None,
+                'absence_type': None,
+                'absence_request_id': None,
+                'astreinte_location': None,
+                'astreinte_type': None,
+                'description': activity.get('description'),
+                'status': status,
+                **fields
+            })
 
     try:
+        # One executemany INSERT per chunk, all inside the same transaction
+        for start in range(0, len(entry_rows), BULK_INSERT_CHUNK_SIZE):
+            db.session.execute(DailyTimesheetEntry.__table__.insert(), entry_rows[start:start + BULK_INSERT_CHUNK_SIZE])
         db.session.commit()
         return jsonify({'message': 'Timesheet created successfully', 'monthly_timesheet_id': monthly_timesheet.id}), 201
     except Exception as e:
@@ -254,19 +323,41 @@ def get_monthly_timesheet_by_id(timesheet_id):
     if not monthly_timesheet:
         return jsonify({'error': f'Monthly timesheet with id {timesheet_id} not found'}), 404
 
-    # Fetch all related daily entries
-    daily_entries = DailyTimesheetEntry.query.filter_by(monthly_timesheet_id=timesheet_id).all()
-
-    # Initialize response structure
+    # ETag from a cheap aggregate: any insert, update or delete of an entry changes it
+    last_updated, entries_count = db.session.query(
+        func.max(DailyTimesheetEntry.updated_at),
+        func.count(DailyTimesheetEntry.id)
+    ).filter(DailyTimesheetEntry.monthly_timesheet_id == timesheet_id).one()
+    etag = hashlib.blake2b(
+        f"{timesheet_id}:{monthly_timesheet.updated_at}:{last_updated}:{entries_count}".encode(),
+        digest_size=16
+    ).hexdigest()
+    if request.if_none_match.contains(etag):
+        return '', 304, {'ETag': f'"{etag}"'}
+
+    # Stream the related daily entries in batches instead of materializing them all
+    # (description is not part of this payload, so it is not read from the database)
+    daily_entries = db.session.execute(
+        select(DailyTimesheetEntry)
+        .options(defer(DailyTimesheetEntry.description))
+        .filter_by(monthly_timesheet_id=timesheet_id)
+        .execution_options(yield_per=500)
+    ).scalars()
+
+    # Initialize response structure (mission and internal buckets are created on first use)
     response = {
-        "missions": {},
-        "internal_activities": {},
+        "missions": defaultdict(lambda: {
+            "normal_activity": [],
+            "astreinte": [],
+            "absence": []
+        }),
+        "internal_activities": defaultdict(list),
         "Absences": {}
     }
 
     # Process each daily entry
     for entry in daily_entries:
-        work_date = entry.work_date.isoformat()
+        work_date = entry.work_date
         hours = entry.number_of_hours
 
         # 1️⃣ PROJECT ACTIVITIES (must have mission_id)
@@ -277,14 +368,6 @@ def get_monthly_timesheet_by_id(timesheet_id):
 
             mission_id = entry.mission_id
 
-            # Ensure mission key exists
-            if mission_id not in response["missions"]:
-                response["missions"][mission_id] = {
-                    "normal_activity": [],
-                    "astreinte": [],
-                    "absence": []
-                }
-
             # Astreinte logic
             if entry.mission_activity_type == ProjectActivityType.ASTREINTE:
                 response["missions"][mission_id]["astreinte"].append({
@@ -306,8 +389,6 @@ def get_monthly_timesheet_by_id(timesheet_id):
             if not entry.internal_activity_type:
                 continue
             activity_type = entry.internal_activity_type.value
-            if activity_type not in response["internal_activities"]:
-                response["internal_activities"][activity_type] = []
             response["internal_activities"][activity_type].append({
                 "work_date": work_date,
                 "number_of_hours": hours
@@ -322,13 +403,6 @@ def get_monthly_timesheet_by_id(timesheet_id):
             # Absence linked to a mission
             if entry.mission_id:
                 mission_id = entry.mission_id
-                if mission_id not in response["missions"]:
-                    response["missions"][mission_id] = {
-                        "normal_activity": [],
-                        "astreinte": [],
-                        "absence": []
-                    }
-
                 response["missions"][mission_id]["absence"].append({
                     "work_date": work_date,
                     "number_of_hours": hours,
@@ -349,7 +423,9 @@ def get_monthly_timesheet_by_id(timesheet_id):
                     "number_of_hours": hours
                 })
 
-    return jsonify(response), 200
+    resp = jsonify(response)
+    resp.set_etag(etag)
+    return resp, 200
 
 '''
 @timesheet_bp.route('/api/consultants/<int:consultant_id>/timesheet/<int:year>/<int:month>', methods=['GET'])
@@ -566,7 +642,10 @@ def get_monthly_timesheets():
         return jsonify({'error': 'Year must be between 2000 and 2100'}), 400
     
     # Query timesheets for the specified month/year, excluding 'saved' status
-    timesheets = MonthlyTimesheet.query.filter(
+    timesheets = MonthlyTimesheet.query.options(
+        selectinload(MonthlyTimesheet.consultant),
+        raiseload('*')
+    ).filter(
         MonthlyTimesheet.month == month,
         MonthlyTimesheet.year == year,
         MonthlyTimesheet.status != TimesheetStatus.SAVED
@@ -582,9 +661,9 @@ def get_monthly_timesheets():
         'year': timesheet.year,
         'description': timesheet.description,
         'status': timesheet.status.value,
-        'created_at': timesheet.created_at.isoformat(),
-        'updated_at': timesheet.updated_at.isoformat(),
-        'reviewed_at': timesheet.reviewed_at.isoformat() if timesheet.reviewed_at else None,
+        'created_at': timesheet.created_at,
+        'updated_at': timesheet.updated_at,
+        'reviewed_at': timesheet.reviewed_at,
         'reviewed_by': timesheet.reviewed_by,
         'manager_comments': timesheet.manager_comments
     } for timesheet in timesheets]), 200
@@ -599,9 +678,12 @@ def delete_timesheet(monthly_timesheet_id):
         if not monthly_timesheet:
             return jsonify({'error': f'Monthly timesheet with id {monthly_timesheet_id} not found'}), 404
 
-        # Deletion automatically cascades to DailyTimesheetEntry because of:
-        # daily_entries = db.relationship(..., cascade='all, delete-orphan')
-        db.session.delete(monthly_timesheet)
+        # Delete the daily entries in one statement, then the timesheet, instead of
+        # letting the daily_entries cascade load every entry and delete them one by one
+        db.session.execute(DailyTimesheetEntry.__table__.delete().where(
+            DailyTimesheetEntry.monthly_timesheet_id == monthly_timesheet_id
+        ))
+        db.session.execute(MonthlyTimesheet.__table__.delete().where(MonthlyTimesheet.id == monthly_timesheet_id))
         db.session.commit()
 
         return jsonify({
@@ -626,9 +708,8 @@ def update_timesheet_status():
     new_status_str = data['status']
 
     # Validate new status
-    try:
-        new_status = TimesheetStatus(new_status_str)
-    except ValueError:
+    new_status = lookup_enum(TIMESHEET_STATUS_BY_VALUE, new_status_str)
+    if new_status is None:
         return jsonify({'error': f'Invalid status "{new_status_str}". Must be one of: {[s.value for s in TimesheetStatus]}'}), 400
 
     # Check if the monthly timesheet exists
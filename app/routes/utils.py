@@ -4,16 +4,19 @@ from app.models import (ActivityType, InternalActivityType, ProjectActivityType,
 
 utils_bp = Blueprint('utils', __name__)
 
+# Enum values never change at runtime, so the payload is built once at import
+ENUMS_PAYLOAD = {
+    'activity_types': [e.value for e in ActivityType],
+    'internal_activity_types': [e.value for e in InternalActivityType],
+    'project_activity_types': [e.value for e in ProjectActivityType],
+    'absence_request_types': [e.value for e in AbsenceRequestType],
+    'absence_request_statuses': [e.value for e in AbsenceRequestStatus],
+    'timesheet_statuses': [e.value for e in TimesheetStatus],
+    'astreinte_locations': [e.value for e in AstreinteLocation],
+    'astreinte_types': [e.value for e in AstreinteType]
+}
+
 @utils_bp.route('/api/enums', methods=['GET'])
 def get_enums():
     """Get all available enum values for frontend"""
-    return jsonify({
-        'activity_types': [e.value for e in ActivityType],
-        'internal_activity_types': [e.value for e in InternalActivityType],
-        'project_activity_types': [e.value for e in ProjectActivityType],
-        'absence_request_types': [e.value for e in AbsenceRequestType],
-        'absence_request_statuses': [e.value for e in AbsenceRequestStatus],
-        'timesheet_statuses': [e.value for e in TimesheetStatus],
-        'astreinte_locations': [e.value for e in AstreinteLocation],
-        'astreinte_types': [e.value for e in AstreinteType]
-    })
\ No newline at end of file
+    return jsonify(ENUMS_PAYLOAD)
\ No newline at end of file
@@ -1,21 +1,20 @@
-from datetime import datetime
-from app.models import AbsenceRequestType, AbsenceRequestStatus
+from datetime import datetime, date
+from app.models import (AbsenceRequestType, AbsenceRequestStatus,
+                        ABSENCE_REQUEST_TYPE_BY_VALUE, ABSENCE_REQUEST_STATUS_BY_VALUE, lookup_enum)
 
 def validate_absence_request_type(absence_type_str):
     """Validate absence request type enum"""
-    try:
-        absence_type = AbsenceRequestType(absence_type_str)
-        return True, absence_type
-    except ValueError:
+    absence_type = lookup_enum(ABSENCE_REQUEST_TYPE_BY_VALUE, absence_type_str)
+    if absence_type is None:
         return False, "Invalid absence request type"
+    return True, absence_type
 
 def validate_absence_request_status(status_str):
     """Validate absence request status enum"""
-    try:
-        status = AbsenceRequestStatus(status_str)
-        return True, status
-    except ValueError:
+    status = lookup_enum(ABSENCE_REQUEST_STATUS_BY_VALUE, status_str)
+    if status is None:
         return False, "Invalid absence request status"
+    return True, status
 
 def validate_time_fraction_absence(time_fraction):
     """Validate time fraction for absence (0.5 or 1.0)"""
@@ -37,7 +36,7 @@ def validate_absence_days_data(days_data):
             return False, f"Day {i+1} must have date and time_fraction"
         
         try:
-            absence_date = datetime.strptime(day_data['date'], '%Y-%m-%d').date()
+            absence_date = date.fromisoformat(day_data['date'])
         except ValueError:
             return False, f"Day {i+1}: Invalid date format. Use YYYY-MM-DD"
         
@@ -126,9 +125,8 @@ def validate_review_decisions(day_decisions, absence_request):
         
         decision_day_ids.add(day_id)
         
-        try:
-            status = AbsenceRequestStatus(decision['status'])
-        except ValueError:
+        status = lookup_enum(ABSENCE_REQUEST_STATUS_BY_VALUE, decision['status'])
+        if status is None:
             return False, f"Decision {i+1}: Invalid status"
         
         if status not in [AbsenceRequestStatus.ACCEPTED, AbsenceRequestStatus.REFUSED]:
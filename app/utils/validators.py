@@ -1,5 +1,6 @@
-from datetime import datetime
-from app.models import ActivityType, InternalActivityType, AbsenceRequestType, ProjectActivityType
+from datetime import date
+from app.models import (ACTIVITY_TYPE_BY_VALUE, INTERNAL_ACTIVITY_TYPE_BY_VALUE, ABSENCE_REQUEST_TYPE_BY_VALUE,
+                        PROJECT_ACTIVITY_TYPE_BY_VALUE, lookup_enum)
 
 def validate_required_fields(data, required_fields):
     """Validate that required fields are present in data"""
@@ -25,42 +26,38 @@ def validate_time_fraction(time_fraction):
 def validate_date_format(date_string):
     """Validate date string is in YYYY-MM-DD format"""
     try:
-        parsed_date = datetime.strptime(date_string, '%Y-%m-%d').date()
+        parsed_date = date.fromisoformat(date_string)
         return True, parsed_date
     except ValueError:
         return False, "Invalid date format. Use YYYY-MM-DD"
 
 def validate_activity_type(activity_type_str):
     """Validate activity type enum"""
-    try:
-        activity_type = ActivityType(activity_type_str)
-        return True, activity_type
-    except ValueError:
+    activity_type = lookup_enum(ACTIVITY_TYPE_BY_VALUE, activity_type_str)
+    if activity_type is None:
         return False, "Invalid activity type"
+    return True, activity_type
 
 def validate_internal_activity_type(internal_type_str):
     """Validate internal activity type enum"""
-    try:
-        internal_type = InternalActivityType(internal_type_str)
-        return True, internal_type
-    except ValueError:
+    internal_type = lookup_enum(INTERNAL_ACTIVITY_TYPE_BY_VALUE, internal_type_str)
+    if internal_type is None:
         return False, "Invalid internal activity type"
+    return True, internal_type
 
 def validate_absence_type(absence_type_str):
     """Validate absence type enum"""
-    try:
-        absence_type = AbsenceRequestType(absence_type_str)
-        return True, absence_type
-    except ValueError:
+    absence_type = lookup_enum(ABSENCE_REQUEST_TYPE_BY_VALUE, absence_type_str)
+    if absence_type is None:
         return False, "Invalid absence type"
+    return True, absence_type
 
 def validate_project_activity_type(project_activity_type_str):
     """Validate project activity type enum"""
-    try:
-        project_activity_type = ProjectActivityType(project_activity_type_str)
-        return True, project_activity_type
-    except ValueError:
+    project_activity_type = lookup_enum(PROJECT_ACTIVITY_TYPE_BY_VALUE, project_activity_type_str)
+    if project_activity_type is None:
         return False, "Invalid project activity type"
+    return True, project_activity_type
 
 def validate_year_month(year, month):
     """Validate year and month are within reasonable ranges"""
@@ -8,6 +8,11 @@ class Config:
     """Base configuration class"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key-here'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Cache for read-mostly listing endpoints (Redis when available, in-process otherwise)
+    CACHE_REDIS_URL = os.environ.get('REDIS_URL')
+    CACHE_TYPE = 'RedisCache' if CACHE_REDIS_URL else 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 60
     
     @staticmethod
     def init_app(app):
@@ -16,6 +21,8 @@ class Config:
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
+    # Log a warning for any request issuing more SQL statements than this (catches N+1 loops)
+    SQL_QUERY_WARN_THRESHOLD = 10
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         f'sqlite:///{BASE_DIR / "timesheet.db"}'
 
@@ -24,6 +31,16 @@ class ProductionConfig(Config):
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         f'sqlite:///{BASE_DIR / "timesheet.db"}'
+    # Enough pooled connections for every gthread worker thread, recycled before server-side idle timeouts
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_pre_ping': True,
+        'pool_recycle': 300,
+    }
+    # Production runs several gunicorn workers: an in-process cache would only be invalidated
+    # in the worker that handled a write, so cache only when a shared Redis is configured
+    CACHE_TYPE = 'RedisCache' if Config.CACHE_REDIS_URL else 'NullCache'
 
 class TestingConfig(Config):
     """Testing configuration"""